@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+from collections import deque
+import os
 from pathlib import Path
-from typing import Any, Callable, Dict, Mapping, MutableMapping, TYPE_CHECKING
+import pickle
+from typing import Any, Callable, Dict, FrozenSet, Mapping, MutableMapping, Tuple, TYPE_CHECKING
 
 from .system_commands import get_default_system_funcs
 
 JsonMapping = MutableMapping[str, Any]
 InputPayload = Mapping[str, Any]
 OutputPayload = Dict[str, Any]
+HistoryEntry = Tuple[str, Tuple[str, ...], Tuple[str, ...]]
 
-INPUT_FIELDS = {"input_files", "extra_args"}
-OUTPUT_FIELDS = {"output_files", "is_success", "error_message"}
+INPUT_FIELDS = frozenset({"input_files", "extra_args"})
+OUTPUT_FIELDS = frozenset({"output_files", "is_success", "error_message"})
+
+# Oldest history entries are dropped once a session records this many calls.
+HISTORY_LIMIT = 1000
+
+# Directory listings kept for :list before the cache is cleared wholesale.
+DIR_CACHE_SIZE = 128
 
 if TYPE_CHECKING:
     from .engine import Engine
@@ -19,10 +29,26 @@ if TYPE_CHECKING:
 
 SystemFunc = Callable[[JsonMapping, "Context"], OutputPayload]
 
+_MISSING = object()
+
 
 class Context:
     """Holds CLI runtime state such as current path, history, and system functions."""
 
+    __slots__ = (
+        "_path",
+        "_path_str",
+        "_scripts_path",
+        "history",
+        "system_funcs",
+        "_picklable_system_funcs",
+        "_script_path_cache",
+        "_script_names",
+        "_script_cache_mtime",
+        "_dir_cache",
+        "engine",
+    )
+
     def __init__(
         self,
         path: str | Path | None = None,
@@ -33,11 +59,21 @@ class Context:
     ) -> None:
         base_path = Path(path).resolve() if path else Path.cwd()
         self.path = base_path
-        self.history: list[str] = []
+        self.history: deque[HistoryEntry] = deque(maxlen=HISTORY_LIMIT)
         default_funcs = get_default_system_funcs()
         self.system_funcs: dict[str, SystemFunc] = dict(default_funcs)
         if system_funcs:
             self.system_funcs.update(system_funcs)
+        self._picklable_system_funcs: dict[str, SystemFunc] = {
+            name: handler for name, handler in self.system_funcs.items() if _is_picklable(handler)
+        }
+        # Command name -> resolved top-level script path (None if absent), kept
+        # while the scripts directory's mtime is unchanged.
+        self._script_path_cache: dict[str, Path | None] = {}
+        self._script_names: frozenset[str] | None = None
+        self._script_cache_mtime: int | None = None
+        # Absolute directory path -> (st_mtime_ns, sorted child paths), used by :list.
+        self._dir_cache: dict[str, tuple[int, tuple[str, ...]]] = {}
         self.scripts_path = Path(scripts_path).resolve() if scripts_path else base_path / "scripts"
         if engine is None:
             from .engine import Engine as EngineClass
@@ -45,16 +81,119 @@ class Context:
             engine = EngineClass()
         self.engine = engine
 
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @path.setter
+    def path(self, value: str | Path) -> None:
+        self._path = Path(value)
+        # Cached string form; functors use it on every hop.
+        self._path_str = str(self._path)
+
+    @property
+    def scripts_path(self) -> Path:
+        return self._scripts_path
+
+    @scripts_path.setter
+    def scripts_path(self, value: str | Path) -> None:
+        self._scripts_path = Path(value)
+        self._script_path_cache = {}
+        self._script_names = None
+        self._script_cache_mtime = None
+
+    def revalidate_script_cache(self) -> None:
+        """Forget cached script lookups if the scripts directory has changed."""
+        # Adding or removing a top-level script bumps the directory mtime.
+        mtime = _mtime_ns(self._scripts_path)
+        if mtime != self._script_cache_mtime:
+            self._script_path_cache = {}
+            self._script_names = None
+            self._script_cache_mtime = mtime
+
+    def lookup_script(self, name: str) -> Path | None:
+        """Return the resolved path of the top-level script ``name``, or None if there is none.
+
+        Results are cached; call ``revalidate_script_cache()`` first to pick up
+        scripts added or removed since.
+        """
+        cache = self._script_path_cache
+        script_path = cache.get(name, _MISSING)
+        if script_path is not _MISSING:
+            return script_path
+
+        if self._script_names is None:
+            self._script_names = _scan_user_scripts(self._scripts_path)
+        if name not in self._script_names:
+            cache[name] = None
+            return None
+
+        script_path = (self._scripts_path / f"{name}.py").resolve()
+        if not script_path.is_file():
+            script_path = None
+        cache[name] = script_path
+        return script_path
+
+    def register_system_func(self, name: str, handler: SystemFunc) -> None:
+        """Register a system function, keeping the parallel-worker copy in sync."""
+        self.system_funcs[name] = handler
+        if _is_picklable(handler):
+            self._picklable_system_funcs[name] = handler
+        else:
+            self._picklable_system_funcs.pop(name, None)
+
+    def cached_listing(self, path: str, mtime_ns: int) -> tuple[str, ...] | None:
+        """Return the cached children of ``path`` if its mtime is unchanged."""
+        entry = self._dir_cache.get(path)
+        if entry is not None and entry[0] == mtime_ns:
+            return entry[1]
+        return None
+
+    def cache_listing(self, path: str, mtime_ns: int, children: tuple[str, ...]) -> None:
+        # Clearing instead of LRU bookkeeping keeps every operation a single
+        # atomic dict call, which matters when :list runs in a parallel branch.
+        if len(self._dir_cache) >= DIR_CACHE_SIZE:
+            self._dir_cache.clear()
+        self._dir_cache[path] = (mtime_ns, children)
+
+    def invalidate_dir_cache(self) -> None:
+        """Forget all cached listings; called after any functor that may touch files."""
+        self._dir_cache.clear()
+
     def record_history(self, functor: "Functor", input_payload: JsonMapping) -> None:
-        entry = self._serialize_history(functor, input_payload)
-        self.history.append(entry)
-
-    def _serialize_history(self, functor: "Functor", input_payload: JsonMapping) -> str:
-        joined_input = " ".join(input_payload.get("input_files", []))
-        joined_args = " ".join(input_payload.get("extra_args", []))
-        parts = [functor.name]
-        if joined_input:
-            parts.append(joined_input)
-        if joined_args:
-            parts.append(joined_args)
-        return " ".join(parts)
+        # Keep the raw parts; the display string is only built by :history.
+        self.history.append(
+            (
+                functor.name,
+                tuple(input_payload.get("input_files", ())),
+                tuple(input_payload.get("extra_args", ())),
+            )
+        )
+
+
+def _scan_user_scripts(scripts_path: Path) -> FrozenSet[str]:
+    """Return the command names of the ``.py`` scripts directly under ``scripts_path``."""
+    try:
+        with os.scandir(scripts_path) as entries:
+            return frozenset(
+                entry.name[:-3]
+                for entry in entries
+                if entry.name.endswith(".py") and entry.is_file()
+            )
+    except OSError:
+        return frozenset()
+
+
+def _mtime_ns(path: Path | str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _is_picklable(handler: SystemFunc) -> bool:
+    try:
+        pickle.dumps(handler)
+    except Exception:
+        return False
+    return True
@@ -1,18 +1,38 @@
 from __future__ import annotations
 
-from typing import Any, Mapping, TYPE_CHECKING
+import atexit
+from collections import OrderedDict
+import os
+import threading
+from typing import Any, Mapping, Optional, TYPE_CHECKING
 
-from .parser import parse
+from .context import _mtime_ns
+from .parser import _parse_tracked
 from .pipeline import pipe_process
 
 if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
     from .context import Context
     from .functors import Functor
 
+PARSE_CACHE_SIZE = 256
+
+_ParseKey = tuple[str, str, Optional[int]]
+# Parsed plan, the script subdirectories it depends on, and their mtimes at parse time.
+_ParseEntry = tuple["Functor", tuple[str, ...], tuple[Optional[int], ...]]
+
 
 class Engine:
     """CLI engine that parses commands and executes functor pipelines."""
 
+    def __init__(self) -> None:
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_context: bytes | None = None
+        self._atexit_registered = False
+        self._parse_cache: OrderedDict[_ParseKey, _ParseEntry] = OrderedDict()
+        self._parse_lock = threading.Lock()
+
     def run(
         self,
         context: "Context",
@@ -23,7 +43,30 @@ class Engine:
         return self.execute(context, functor, payload)
 
     def parse(self, context: "Context", command: str) -> "Functor":
-        return parse(command, context)
+        """Parse ``command``, reusing the functor tree while the scripts it resolves are unchanged.
+
+        The key covers the top-level scripts directory; plans that looked up
+        nested scripts (``sub/name``) are also checked against the mtimes of
+        those subdirectories before being reused.
+        """
+        key = (command, str(context.scripts_path), _mtime_ns(context.scripts_path))
+        with self._parse_lock:
+            entry = self._parse_cache.get(key)
+            if entry is not None:
+                self._parse_cache.move_to_end(key)
+        if entry is not None:
+            functor, nested_dirs, nested_mtimes = entry
+            if not nested_dirs or tuple(map(_mtime_ns, nested_dirs)) == nested_mtimes:
+                return functor
+
+        functor, nested_dirs = _parse_tracked(command, context)
+        # Taken after parsing: a change racing the parse only causes a reparse later.
+        nested_mtimes = tuple(map(_mtime_ns, nested_dirs))
+        with self._parse_lock:
+            self._parse_cache[key] = (functor, nested_dirs, nested_mtimes)
+            if len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return functor
 
     def execute(
         self,
@@ -32,3 +75,35 @@ class Engine:
         payload: Mapping[str, Any] | None = None,
     ) -> Mapping[str, Any]:
         return functor(context, payload)
+
+    def get_process_pool(self, pickled_context: bytes) -> ProcessPoolExecutor:
+        """Return the persistent worker pool, restarting it if the worker context changed."""
+        if self._pool is not None and self._pool_context != pickled_context:
+            self.shutdown()
+        if self._pool is None:
+            # Deferred so CLI startup does not pay for multiprocessing.
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import resource_tracker
+
+            from .functors import _init_parallel_worker
+
+            # Workers must share the parent's tracker so shared-memory blocks
+            # created on one side and unlinked on the other stay balanced.
+            resource_tracker.ensure_running()
+            self._pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                initializer=_init_parallel_worker,
+                initargs=(pickled_context,),
+            )
+            self._pool_context = pickled_context
+            if not self._atexit_registered:
+                atexit.register(self.shutdown)
+                self._atexit_registered = True
+        return self._pool
+
+    def shutdown(self) -> None:
+        """Close the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._pool_context = None
@@ -1,45 +1,171 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from concurrent.futures import ProcessPoolExecutor
 import json
 import os
 import pickle
+import signal
 import subprocess
 import sys
 import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Dict, Mapping, Sequence
+from typing import IO, TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence
 
-from .context import Context, INPUT_FIELDS, OUTPUT_FIELDS, InputPayload, JsonMapping, OutputPayload
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from .context import (
+    Context,
+    INPUT_FIELDS,
+    OUTPUT_FIELDS,
+    InputPayload,
+    JsonMapping,
+    OutputPayload,
+)
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+
+_WORKER_CONTEXT: Context | None = None
+
+# File lists longer than this cross the process boundary through shared memory.
+SHARED_MEMORY_THRESHOLD = 1024
+
+SharedFiles = tuple[str, int]
+_BranchResult = tuple["Functor", Optional[OutputPayload], Optional[BaseException]]
+
+# Script output buffers live on a RAM-backed filesystem when one is available.
+_BUFFER_DIR = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+# Match the default Linux pipe capacity so each flush fills the pipe in one write.
+# With the 8 KiB default, streaming 200k paths through cat takes about twice as long.
+_PIPE_BUFFER_SIZE = 64 * 1024
+
+# Builtin input longer than this many lines is streamed from a writer thread
+# instead of being joined into one string for communicate().
+_STDIN_STREAM_THRESHOLD = 10_000
+
+
+def _json_dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _init_parallel_worker(pickled_context: bytes) -> None:
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = Context(**pickle.loads(pickled_context))
 
 
 def _execute_functor_parallel(
     functor: "Functor",
-    context_kwargs: Dict[str, Any],
     payload: JsonMapping,
-) -> OutputPayload:
-    worker_context = Context(**context_kwargs)
-    return functor(worker_context, payload)
+    shared_inputs: SharedFiles | None = None,
+) -> tuple[OutputPayload, SharedFiles | None]:
+    if _WORKER_CONTEXT is None:
+        raise FunctorExecutionError("Parallel worker context was not initialized.")
+    if shared_inputs is not None:
+        payload["input_files"] = _read_shared_files(shared_inputs, unlink=False)
+
+    result = functor(_WORKER_CONTEXT, payload)
+    output_files = result.get("output_files") if isinstance(result, Mapping) else None
+    if not output_files or len(output_files) <= SHARED_MEMORY_THRESHOLD:
+        return result, None
+
+    shm, size = _write_shared_files(output_files)
+    shm.close()
+    result = dict(result)
+    result["output_files"] = []
+    return result, (shm.name, size)
+
+
+def _write_shared_files(files: Sequence[str]) -> tuple[SharedMemory, int]:
+    # multiprocessing is only needed on the cpu-bound path; keep it off startup.
+    from multiprocessing.shared_memory import SharedMemory
+
+    data = "\n".join(files).encode("utf-8")
+    shm = SharedMemory(create=True, size=max(len(data), 1))
+    shm.buf[: len(data)] = data
+    return shm, len(data)
+
+
+def _read_shared_files(shared: SharedFiles, *, unlink: bool) -> list[str]:
+    from multiprocessing.shared_memory import SharedMemory
+
+    name, size = shared
+    shm = SharedMemory(name=name)
+    try:
+        data = bytes(shm.buf[:size])
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
+    return data.decode("utf-8").split("\n") if size else []
 
 
 def _serialize_context_for_parallel(context: Context) -> Dict[str, Any]:
     data: Dict[str, Any] = {
-        "path": str(context.path),
+        "path": context._path_str,
         "scripts_path": str(context.scripts_path),
     }
-    if context.system_funcs:
-        picklable_funcs: Dict[str, Any] = {}
-        for name, handler in context.system_funcs.items():
-            try:
-                pickle.dumps(handler)
-            except Exception:
-                continue
-            picklable_funcs[name] = handler
-        if picklable_funcs:
-            data["system_funcs"] = picklable_funcs
+    if context._picklable_system_funcs:
+        data["system_funcs"] = dict(context._picklable_system_funcs)
     return data
 
+
+def _start_stdin_writer(process: subprocess.Popen, lines: Sequence[str]) -> threading.Thread | None:
+    """Stream newline-separated ``lines`` into the child's stdin on a background thread.
+
+    The pipe is detached from ``process`` so ``communicate()`` only drains
+    stdout/stderr while the writer fills stdin, avoiding a joined copy of
+    the whole input.
+    """
+    stdin = process.stdin
+    if stdin is None:
+        return None
+    process.stdin = None
+    writer = threading.Thread(target=_write_lines, args=(stdin, lines), daemon=True)
+    writer.start()
+    return writer
+
+
+def _write_lines(stream: IO[str], lines: Sequence[str]) -> None:
+    # Join pipe-sized chunks: one write per line keeps the writer contending
+    # with communicate() for the GIL and ends up slower than a single join.
+    try:
+        chunk: list[str] = []
+        size = 0
+        separator = ""
+        for line in lines:
+            chunk.append(line)
+            size += len(line) + 1
+            if size >= _PIPE_BUFFER_SIZE:
+                stream.write(separator + "\n".join(chunk))
+                separator = "\n"
+                chunk = []
+                size = 0
+        if chunk:
+            stream.write(separator + "\n".join(chunk))
+    except BrokenPipeError:
+        # The child exited without reading all of its input.
+        pass
+    finally:
+        try:
+            stream.close()
+        except BrokenPipeError:
+            pass
+
+
 class FunctorExecutionError(RuntimeError):
     """Raised when a functor produces malformed data."""
 
@@ -47,6 +173,16 @@ class FunctorExecutionError(RuntimeError):
 class Functor(ABC):
     """Base class for CLI commands wrapped as functors."""
 
+    __slots__ = ("name", "_default_input_files", "_default_extra_args", "_viz_schedule")
+
+    # Set on subclasses doing CPU-heavy work in Python so ParallelFunctor runs
+    # them in worker processes instead of threads.
+    cpu_bound = False
+    # Whether calls are appended to the context history.
+    records_history = True
+    # Whether a call may change the filesystem; if so the directory listing cache is dropped.
+    modifies_files = True
+
     def __init__(
         self,
         name: str,
@@ -55,39 +191,60 @@ class Functor(ABC):
         default_extra_args: Sequence[str] | None = None,
     ) -> None:
         self.name = name
-        self._default_input_files = list(default_input_files) if default_input_files is not None else None
-        self._default_extra_args = list(default_extra_args) if default_extra_args is not None else None
+        self._default_input_files = tuple(default_input_files) if default_input_files is not None else None
+        self._default_extra_args = tuple(default_extra_args) if default_extra_args is not None else None
+        # Flattened (depth, descriptor) rows, filled in by visualize() on first use.
+        self._viz_schedule: tuple[tuple[int, str], ...] | None = None
 
-    def __call__(self, context: Context, payload: InputPayload | None = None) -> OutputPayload:
-        """Normalize the input payload, execute the functor, and validate the output."""
-        normalized = self._normalize_input(context, payload)
-        output = self.execute(context, normalized)
+    def __call__(
+        self,
+        context: Context,
+        payload: InputPayload | None = None,
+        *,
+        trusted: bool = False,
+    ) -> OutputPayload:
+        """Normalize the input payload, execute the functor, and validate the output.
+
+        ``trusted`` skips the unknown-key check for payloads built by the engine
+        itself, which only ever carry ``input_files`` and ``extra_args``.
+        """
+        normalized = self._normalize_input(context, payload, trusted=trusted)
+        try:
+            output = self.execute(context, normalized)
+        finally:
+            if self.modifies_files:
+                context.invalidate_dir_cache()
         self._validate_output(output)
-        if self._should_record_history():
+        if self.records_history:
             context.record_history(functor=self, input_payload=normalized)
         return output
 
-    def _normalize_input(self, context: Context, payload: InputPayload | None) -> JsonMapping:
-        if payload:
-            unknown = set(payload.keys()) - INPUT_FIELDS
-            if unknown:
-                raise FunctorExecutionError(
-                    f"Functor '{self.name}' received unsupported fields: {', '.join(sorted(unknown))}"
-                )
+    def _normalize_input(
+        self,
+        context: Context,
+        payload: InputPayload | None,
+        *,
+        trusted: bool = False,
+    ) -> JsonMapping:
+        if payload and not trusted and not INPUT_FIELDS.issuperset(payload):
+            unknown = sorted(set(payload.keys()) - INPUT_FIELDS)
+            raise FunctorExecutionError(
+                f"Functor '{self.name}' received unsupported fields: {', '.join(unknown)}"
+            )
 
         normalized: JsonMapping = {
-            "input_files": list(payload.get("input_files", [])) if payload else [],
-            "extra_args": list(payload.get("extra_args", [])) if payload else [],
+            "input_files": tuple(payload.get("input_files", ())) if payload else (),
+            "extra_args": tuple(payload.get("extra_args", ())) if payload else (),
         }
 
         if not normalized["input_files"]:
             if self._default_input_files is not None:
-                normalized["input_files"] = list(self._default_input_files)
+                normalized["input_files"] = self._default_input_files
             else:
-                normalized["input_files"] = [str(context.path)]
+                normalized["input_files"] = (context._path_str,)
 
         if not normalized["extra_args"] and self._default_extra_args is not None:
-            normalized["extra_args"] = list(self._default_extra_args)
+            normalized["extra_args"] = self._default_extra_args
 
         return normalized
 
@@ -95,21 +252,20 @@ class Functor(ABC):
         if not isinstance(payload, Mapping):
             raise FunctorExecutionError(f"Functor '{self.name}' returned a non-mapping payload.")
 
-        missing = OUTPUT_FIELDS - payload.keys()
-        if missing - {"error_message"}:
+        # error_message is optional, so only these two keys are required.
+        if "output_files" not in payload or "is_success" not in payload:
+            missing = sorted(OUTPUT_FIELDS - payload.keys())
             raise FunctorExecutionError(
-                f"Functor '{self.name}' output missing fields: {', '.join(sorted(missing))}"
+                f"Functor '{self.name}' output missing fields: {', '.join(missing)}"
             )
 
-        unknown = set(payload.keys()) - OUTPUT_FIELDS
-        if unknown:
+        # issuperset() walks the keys in C without building a temporary set.
+        if not OUTPUT_FIELDS.issuperset(payload):
+            unknown = sorted(set(payload.keys()) - OUTPUT_FIELDS)
             raise FunctorExecutionError(
-                f"Functor '{self.name}' output included unsupported fields: {', '.join(sorted(unknown))}"
+                f"Functor '{self.name}' output included unsupported fields: {', '.join(unknown)}"
             )
 
-    def _should_record_history(self) -> bool:
-        return True
-
     @abstractmethod
     def execute(self, context: Context, payload: JsonMapping) -> OutputPayload:
         """Perform the command's work using normalized JSON input."""
@@ -118,6 +274,8 @@ class Functor(ABC):
 class BuiltinFunctor(Functor):
     """Functor implementation for built-in shell commands."""
 
+    __slots__ = ("command", "_command_tuple", "cwd")
+
     def __init__(
         self,
         name: str,
@@ -128,26 +286,24 @@ class BuiltinFunctor(Functor):
     ) -> None:
         super().__init__(name, default_input_files=[], default_extra_args=default_extra_args)
         self.command = list(command)
+        self._command_tuple = tuple(command)
         self.cwd = str(cwd) if cwd else None
 
     def execute(self, context: Context, payload: JsonMapping) -> OutputPayload:
         input_files = payload.get("input_files", [])
         extra_args = payload.get("extra_args", [])
 
-        cmd = list(self.command)
-        if extra_args:
-            cmd.extend(extra_args)
-
-        stdin_data = "\n".join(input_files) if input_files else None
+        cmd = self._command_tuple + tuple(extra_args) if extra_args else self._command_tuple
 
         try:
-            completed = subprocess.run(
+            process = subprocess.Popen(
                 cmd,
-                input=stdin_data,
-                capture_output=True,
+                stdin=subprocess.PIPE if input_files else None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                check=False,
-                cwd=self.cwd or str(context.path),
+                bufsize=_PIPE_BUFFER_SIZE,
+                cwd=self.cwd or context._path_str,
             )
         except FileNotFoundError as exc:
             return {
@@ -156,11 +312,25 @@ class BuiltinFunctor(Functor):
                 "error_message": str(exc),
             }
 
-        is_success = completed.returncode == 0
-        stdout_lines = [line.strip() for line in completed.stdout.splitlines() if line.strip()]
-        output_files = stdout_lines if stdout_lines else list(input_files)
+        with process:
+            # Below the threshold a thread costs more than joining the input.
+            stream = len(input_files) > _STDIN_STREAM_THRESHOLD
+            writer = _start_stdin_writer(process, input_files) if stream else None
+            stdin_data = "\n".join(input_files) if input_files and not stream else None
+            try:
+                stdout, stderr = process.communicate(stdin_data)
+            except BaseException:
+                process.kill()
+                raise
+            finally:
+                if writer is not None:
+                    writer.join()
+
+        is_success = process.returncode == 0
+        stdout_lines = [line for line in map(str.strip, stdout.splitlines()) if line]
+        output_files = stdout_lines if stdout_lines else input_files
 
-        error_message = completed.stderr.strip() if not is_success else ""
+        error_message = stderr.strip() if not is_success else ""
 
         return {
             "output_files": output_files,
@@ -168,10 +338,135 @@ class BuiltinFunctor(Functor):
             "error_message": error_message or None,
         }
 
+    @classmethod
+    def run_chain(
+        cls,
+        context: Context,
+        stages: Sequence["BuiltinFunctor"],
+        payload: JsonMapping,
+    ) -> tuple[OutputPayload, "BuiltinFunctor"]:
+        """Run consecutive builtins as one OS-level pipeline.
+
+        Each stage's stdout is connected directly to the next stage's stdin, so
+        intermediate output never passes through Python; only the last stage's
+        stdout becomes ``output_files``. Returns the result together with the
+        stage it describes: the first failing stage, or the last one.
+
+        Intermediate output is never seen, so when the last stage prints nothing
+        or any stage fails, ``output_files`` falls back to the chain's own
+        ``input_files``, not to the input of that stage.
+        """
+        input_files = payload.get("input_files", ())
+        extra_args = payload.get("extra_args", ())
+
+        processes: list[tuple[BuiltinFunctor, subprocess.Popen, IO[bytes] | None]] = []
+        writer: threading.Thread | None = None
+        previous_stdout: IO[str] | None = None
+        # Every exit path, including a stage that fails to start, must close
+        # the spooled stderr files of the stages that did start.
+        try:
+            try:
+                for index, stage in enumerate(stages):
+                    args = stage._default_extra_args or ()
+                    if index == 0 and extra_args:
+                        args = extra_args
+                    is_last = index == len(stages) - 1
+                    # Upstream stderr goes to a spool file so no pipe can fill up
+                    # while only the last stage is being drained.
+                    stderr_file = None if is_last else tempfile.TemporaryFile()
+                    if index == 0:
+                        stdin = subprocess.PIPE if input_files else None
+                    else:
+                        stdin = previous_stdout
+                    try:
+                        process = subprocess.Popen(
+                            stage._command_tuple + tuple(args),
+                            stdin=stdin,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE if is_last else stderr_file,
+                            text=True,
+                            bufsize=_PIPE_BUFFER_SIZE,
+                            cwd=stage.cwd or context._path_str,
+                        )
+                    except FileNotFoundError as exc:
+                        if stderr_file is not None:
+                            stderr_file.close()
+                        return {
+                            "output_files": input_files,
+                            "is_success": False,
+                            "error_message": str(exc),
+                        }, stage
+                    finally:
+                        # The child holds its own copy; closing ours lets upstream
+                        # stages see SIGPIPE if a downstream stage exits early.
+                        if previous_stdout is not None:
+                            previous_stdout.close()
+                            previous_stdout = None
+
+                    processes.append((stage, process, stderr_file))
+                    context.record_history(
+                        functor=stage,
+                        input_payload={
+                            "input_files": input_files if index == 0 else (),
+                            "extra_args": args,
+                        },
+                    )
+                    if index == 0:
+                        writer = _start_stdin_writer(process, input_files)
+                    if not is_last:
+                        previous_stdout = process.stdout
+                        process.stdout = None
+
+                last_stage, last_process, _ = processes[-1]
+                stdout, last_stderr = last_process.communicate()
+                for _, process, _ in processes[:-1]:
+                    process.wait()
+            except BaseException:
+                for _, process, _ in processes:
+                    process.kill()
+                raise
+            finally:
+                for _, process, _ in processes:
+                    process.wait()
+                if writer is not None:
+                    writer.join()
+                # run_chain bypasses Functor.__call__ when pipe_process fuses stages.
+                context.invalidate_dir_cache()
+
+            for stage, process, stderr_file in processes:
+                returncode = process.returncode
+                # An upstream stage killed by SIGPIPE only means a later stage
+                # stopped reading early, as in `cat big.txt | head -1`.
+                if returncode == 0 or (stage is not last_stage and returncode == -signal.SIGPIPE):
+                    continue
+                if stderr_file is not None:
+                    stderr_file.seek(0)
+                    stderr = stderr_file.read().decode(errors="replace")
+                else:
+                    stderr = last_stderr
+                return {
+                    "output_files": input_files,
+                    "is_success": False,
+                    "error_message": stderr.strip() or None,
+                }, stage
+        finally:
+            for _, _, stderr_file in processes:
+                if stderr_file is not None:
+                    stderr_file.close()
+
+        stdout_lines = [line for line in map(str.strip, stdout.splitlines()) if line]
+        return {
+            "output_files": stdout_lines if stdout_lines else input_files,
+            "is_success": True,
+            "error_message": None,
+        }, last_stage
+
 
 class UserDefinedFunctor(Functor):
     """Functor that executes a Python script located in the scripts directory."""
 
+    __slots__ = ("script_path", "python_executable", "cwd")
+
     def __init__(
         self,
         name: str,
@@ -195,16 +490,14 @@ class UserDefinedFunctor(Functor):
         buffer_path = self._create_output_buffer()
         payload_with_buffer = dict(payload)
         payload_with_buffer["output_buffer"] = buffer_path
-        print(f"{buffer_path=}")
-        serialized = json.dumps(payload_with_buffer)
+        serialized = _json_dumps(payload_with_buffer)
         try:
             completed = subprocess.run(
                 [self.python_executable, self.script_path],
                 input=serialized,
-                text=True,
                 capture_output=False, # prints in the user scripts will be emitted
                 check=False,
-                cwd=self.cwd or str(context.path),
+                cwd=self.cwd or context._path_str,
             )
         except FileNotFoundError as exc:
             self._cleanup_buffer(buffer_path)
@@ -234,14 +527,13 @@ class UserDefinedFunctor(Functor):
         return output_payload
 
     def _create_output_buffer(self) -> str:
-        buffer = tempfile.NamedTemporaryFile(delete=False)
-        buffer_path = buffer.name
-        buffer.close()
+        fd, buffer_path = tempfile.mkstemp(prefix="astro_", suffix=".json", dir=_BUFFER_DIR)
+        os.close(fd)
         return buffer_path
 
     def _load_output_buffer(self, buffer_path: str) -> tuple[OutputPayload | None, str | None]:
         try:
-            raw = Path(buffer_path).read_text().strip()
+            raw = Path(buffer_path).read_bytes().strip()
         except FileNotFoundError:
             return None, "Script did not produce an output buffer."
 
@@ -249,28 +541,27 @@ class UserDefinedFunctor(Functor):
             return None, "Script wrote an empty output buffer."
 
         try:
-            payload = json.loads(raw)
+            payload = _json_loads(raw)
         except json.JSONDecodeError as exc:
             return None, f"Invalid JSON output: {exc}"
 
         return payload, None
 
     def _cleanup_buffer(self, buffer_path: str) -> None:
-        try:
-            os.remove(buffer_path)
-        except FileNotFoundError:
-            pass
+        Path(buffer_path).unlink(missing_ok=True)
 
 
 class SystemFunctor(Functor):
     """Functor that delegates to context-registered system functions."""
 
+    __slots__ = ()
+
+    records_history = False
+    modifies_files = False
+
     def __init__(self, name: str, *, default_extra_args: Sequence[str] | None = None) -> None:
         super().__init__(name, default_input_files=[], default_extra_args=default_extra_args)
 
-    def _should_record_history(self) -> bool:
-        return False
-
     def execute(self, context: Context, payload: JsonMapping) -> OutputPayload:
         handler = context.system_funcs.get(self.name)
         if handler is None:
@@ -281,23 +572,39 @@ class SystemFunctor(Functor):
 
 
 class SequentialFunctor(Functor):
-    """Functor that composes a sequence of sub-functors sequentially."""
+    """Functor that composes a sequence of sub-functors sequentially.
+
+    When every stage is a BuiltinFunctor the chain is run as one OS pipeline
+    (see ``BuiltinFunctor.run_chain``): intermediate output flows through
+    kernel pipes verbatim instead of being split into ``output_files``. If the
+    last stage prints nothing, or any stage fails, ``output_files`` is then the
+    chain's own input rather than that stage's input: ``ls | sleep 0`` returns
+    the input given to ``ls``, not its listing.
+    """
+
+    __slots__ = ("functors", "_builtin_chain")
 
     def __init__(self, name: str, functors: Sequence[Functor]) -> None:
         if not functors:
             raise ValueError("SequentialFunctor requires at least one sub-functor.")
         super().__init__(name)
         self.functors = list(functors)
+        # Plain builtin chains run as one OS pipeline; subclasses may override
+        # execute(), so only exact BuiltinFunctor instances qualify.
+        self._builtin_chain = len(self.functors) > 1 and all(
+            type(functor) is BuiltinFunctor for functor in self.functors
+        )
 
     def execute(self, context: Context, payload: JsonMapping) -> OutputPayload:
-        current_payload: JsonMapping = {
-            "input_files": list(payload.get("input_files", [])),
-            "extra_args": list(payload.get("extra_args", [])),
-        }
+        if self._builtin_chain:
+            result, _ = BuiltinFunctor.run_chain(context, self.functors, payload)
+            return result
+
+        current_payload: JsonMapping = payload
         last_result: OutputPayload | None = None
 
         for functor in self.functors:
-            result = functor(context, current_payload)
+            result = functor(context, current_payload, trusted=True)
             if not result.get("is_success"):
                 return result
 
@@ -308,20 +615,27 @@ class SequentialFunctor(Functor):
                 )
 
             current_payload = {
-                "input_files": list(output_files),
-                "extra_args": [],
+                "input_files": tuple(output_files),
+                "extra_args": (),
             }
             last_result = result
 
         return last_result or {
-            "output_files": list(payload.get("input_files", [])),
+            "output_files": payload["input_files"],
             "is_success": True,
             "error_message": None,
         }
 
 
 class ParallelFunctor(Functor):
-    """Functor that executes multiple sub-functors in parallel and aggregates their outputs."""
+    """Functor that executes multiple sub-functors in parallel and aggregates their outputs.
+
+    Branches run on threads by default: sub-functors spend their time waiting on
+    child processes, so the GIL is not a bottleneck. A process pool is used only
+    when a branch is marked ``cpu_bound``.
+    """
+
+    __slots__ = ("functors",)
 
     def __init__(self, name: str, functors: Sequence[Functor]) -> None:
         if not functors:
@@ -330,33 +644,19 @@ class ParallelFunctor(Functor):
         self.functors = list(functors)
 
     def execute(self, context: Context, payload: JsonMapping) -> OutputPayload:
-        base_input_files = list(payload.get("input_files", []))
-        base_extra_args = list(payload.get("extra_args", []))
+        base_input_files = payload["input_files"]
+        base_extra_args = payload["extra_args"]
 
-        context_kwargs = _serialize_context_for_parallel(context)
+        if any(functor.cpu_bound for functor in self.functors):
+            results = self._run_in_processes(context, base_input_files, base_extra_args)
+        else:
+            results = self._run_in_threads(context, base_input_files, base_extra_args)
 
-        tasks = []
-        with ProcessPoolExecutor(max_workers=len(self.functors)) as executor:
-            for functor in self.functors:
-                functor_payload: JsonMapping = {
-                    "input_files": list(base_input_files),
-                    "extra_args": list(base_extra_args),
-                }
-                future = executor.submit(
-                    _execute_functor_parallel,
-                    functor,
-                    context_kwargs,
-                    functor_payload,
-                )
-                tasks.append((functor, future))
-
-        combined_outputs: list[str] = []
+        branch_outputs: list[Sequence[str]] = []
         errors: list[str] = []
 
-        for functor, future in tasks:
-            try:
-                result = future.result()
-            except Exception as exc:
+        for functor, result, exc in results:
+            if exc is not None:
                 errors.append(f"{functor.name}: {exc}")
                 continue
 
@@ -370,17 +670,97 @@ class ParallelFunctor(Functor):
                 raise FunctorExecutionError(
                     f"Functor '{functor.name}' produced an empty 'output_files' value."
                 )
-            combined_outputs.extend(output_files)
+            branch_outputs.append(output_files)
 
         if errors:
             return {
-                "output_files": list(base_input_files),
+                "output_files": base_input_files,
                 "is_success": False,
                 "error_message": "; ".join(errors),
             }
 
+        # Size the result once and fill it by slice instead of growing it per branch.
+        combined_outputs: list[str] = [""] * sum(map(len, branch_outputs))
+        start = 0
+        for output_files in branch_outputs:
+            end = start + len(output_files)
+            combined_outputs[start:end] = output_files
+            start = end
+
         return {
             "output_files": combined_outputs,
             "is_success": True,
             "error_message": None,
         }
+
+    def _run_in_threads(
+        self,
+        context: Context,
+        base_input_files: Sequence[str],
+        base_extra_args: Sequence[str],
+    ) -> list[_BranchResult]:
+        # concurrent.futures pulls in logging; import it on first parallel run.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(self.functors)) as executor:
+            tasks = []
+            for functor in self.functors:
+                functor_payload: JsonMapping = {
+                    "input_files": base_input_files,
+                    "extra_args": base_extra_args,
+                }
+                tasks.append((functor, executor.submit(functor, context, functor_payload)))
+
+        results: list[_BranchResult] = []
+        for functor, future in tasks:
+            try:
+                results.append((functor, future.result(), None))
+            except Exception as exc:
+                results.append((functor, None, exc))
+        return results
+
+    def _run_in_processes(
+        self,
+        context: Context,
+        base_input_files: Sequence[str],
+        base_extra_args: Sequence[str],
+    ) -> list[_BranchResult]:
+        pickled_context = pickle.dumps(_serialize_context_for_parallel(context))
+        executor = context.engine.get_process_pool(pickled_context)
+
+        shared_inputs: SharedFiles | None = None
+        shm: SharedMemory | None = None
+        if len(base_input_files) > SHARED_MEMORY_THRESHOLD:
+            shm, size = _write_shared_files(base_input_files)
+            shared_inputs = (shm.name, size)
+
+        tasks = []
+        try:
+            for functor in self.functors:
+                functor_payload: JsonMapping = {
+                    "input_files": () if shared_inputs else base_input_files,
+                    "extra_args": base_extra_args,
+                }
+                future = executor.submit(
+                    _execute_functor_parallel,
+                    functor,
+                    functor_payload,
+                    shared_inputs,
+                )
+                tasks.append((functor, future))
+
+            results: list[_BranchResult] = []
+            for functor, future in tasks:
+                try:
+                    result, shared_outputs = future.result()
+                except Exception as exc:
+                    results.append((functor, None, exc))
+                    continue
+                if shared_outputs is not None:
+                    result["output_files"] = _read_shared_files(shared_outputs, unlink=True)
+                results.append((functor, result, None))
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+        return results
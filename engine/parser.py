@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from pathlib import Path
+import re
 from typing import List, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -20,71 +22,69 @@ class ParseError(ValueError):
 
 
 def parse(command: str, context: "Context") -> Functor:
+    return _parse_tracked(command, context)[0]
+
+
+def _parse_tracked(command: str, context: "Context") -> tuple[Functor, tuple[str, ...]]:
+    """Parse ``command`` and also return the script subdirectories it consulted.
+
+    Scripts in subdirectories are not covered by the scripts_path mtime, so a
+    caller caching the result must also watch these directories.
+    """
     tokens = _tokenize(command)
     if not tokens:
         raise ParseError("Empty command.")
     parser = _Parser(tokens, context)
     result = parser.parse_expression()
     parser.expect_end()
-    return result
-
-
-def _tokenize(command: str) -> List[str]:
-    tokens: List[str] = []
-    current: List[str] = []
-    quote: str | None = None
-    escaped = False
-
-    for ch in command:
-        if quote:
-            if escaped:
-                current.append(ch)
-                escaped = False
-            elif ch == "\\":
-                escaped = True
-            elif ch == quote:
-                tokens.append("".join(current))
-                current = []
-                quote = None
-            else:
-                current.append(ch)
-            continue
+    return result, tuple(parser.nested_dirs)
 
-        if ch in ("'", '"'):
-            if current:
-                tokens.append("".join(current))
-                current = []
-            quote = ch
-            continue
 
-        if ch.isspace():
-            if current:
-                tokens.append("".join(current))
-                current = []
-            continue
+# Quoted strings use the "unrolled loop" form so the regex engine consumes
+# runs of ordinary characters without per-character backtracking.
+_DOUBLE_QUOTED = r'"([^"\\]*(?:\\.[^"\\]*)*)"'
+_SINGLE_QUOTED = r"'([^'\\]*(?:\\.[^'\\]*)*)'"
+_TOKEN_PATTERN = re.compile(
+    rf"([^\s|(),'\"]+|[|(),])|{_DOUBLE_QUOTED}|{_SINGLE_QUOTED}",
+    re.DOTALL,
+)
+# Also unrolled: unquoted runs exclude quote characters, so every quote must start
+# a quoted string and an unterminated one fails in linear time. A nested
+# (?:[^'"]+|...)* would backtrack exponentially over a long unquoted prefix.
+_BALANCED_QUOTES_PATTERN = re.compile(
+    rf"[^'\"]*(?:(?:{_DOUBLE_QUOTED}|{_SINGLE_QUOTED})[^'\"]*)*",
+    re.DOTALL,
+)
+_ESCAPE_PATTERN = re.compile(r"\\(.)", re.DOTALL)
 
-        if ch in "|(),":
-            if current:
-                tokens.append("".join(current))
-                current = []
-            tokens.append(ch)
-        else:
-            current.append(ch)
 
-    if quote:
+def _tokenize(command: str) -> List[str]:
+    if _BALANCED_QUOTES_PATTERN.fullmatch(command) is None:
         raise ParseError("Unterminated quote in command.")
 
-    if current:
-        tokens.append("".join(current))
+    tokens: List[str] = []
+    append = tokens.append
+    unescape = _ESCAPE_PATTERN.sub
+    # findall skips whitespace and builds every match tuple in C.
+    for word, double_quoted, single_quoted in _TOKEN_PATTERN.findall(command):
+        if word:
+            append(word)
+            continue
+        quoted = double_quoted or single_quoted
+        append(unescape(r"\1", quoted) if "\\" in quoted else quoted)
 
     return tokens
 
 
-@dataclass
 class _Parser:
-    tokens: Sequence[str]
-    context: "Context"
-    pos: int = 0
+    __slots__ = ("tokens", "context", "pos", "_script_cache_checked", "nested_dirs")
+
+    def __init__(self, tokens: Sequence[str], context: "Context", pos: int = 0) -> None:
+        self.tokens = tokens
+        self.context = context
+        self.pos = pos
+        self._script_cache_checked = False
+        self.nested_dirs: List[str] = []
 
     def parse_expression(self) -> Functor:
         return self._parse_parallel()
@@ -127,13 +127,16 @@ class _Parser:
     def _parse_command(self) -> Functor:
         name = self._consume_word()
         args: List[str] = []
-        while True:
-            token = self._peek()
-            if token is None or token in {"|", ",", ")"}:
+        tokens = self.tokens
+        end = len(tokens)
+        while self.pos < end:
+            token = tokens[self.pos]
+            if token in {"|", ",", ")"}:
                 break
             if token == "(":
                 raise ParseError(f"Unexpected token '{token}' in command arguments.")
-            args.append(self._consume_word())
+            args.append(token)
+            self.pos += 1
         return self._create_functor(name, args)
 
     def _create_functor(self, name: str, args: Sequence[str]) -> Functor:
@@ -150,11 +153,11 @@ class _Parser:
         if raw_name == ":":
             raise ParseError("System command name is missing.")
         command_name = raw_name[1:]
-        return SystemFunctor(command_name, default_extra_args=list(args))
+        return SystemFunctor(command_name, default_extra_args=args)
 
     def _try_create_user_functor(self, name: str, args: Sequence[str]) -> Functor | None:
-        script_path = (self.context.scripts_path / f"{name}.py").resolve()
-        if not script_path.is_file():
+        script_path = self._lookup_script(name)
+        if script_path is None:
             return None
 
         input_files, extra_args = self._split_user_args(args)
@@ -168,6 +171,24 @@ class _Parser:
             default_extra_args=extra_args or None,
         )
 
+    def _lookup_script(self, name: str) -> Path | None:
+        context = self.context
+        if not self._script_cache_checked:
+            context.revalidate_script_cache()
+            self._script_cache_checked = True
+
+        if "/" in name or os.sep in name:
+            if _is_helper_path(name):
+                return None
+            # Scripts in subdirectories are not covered by the mtime check, so
+            # they are looked up every time and reported to the caller instead.
+            candidate = context.scripts_path / f"{name}.py"
+            self.nested_dirs.append(str(candidate.parent))
+            script_path = candidate.resolve()
+            return script_path if script_path.is_file() else None
+
+        return context.lookup_script(name)
+
     def _split_user_args(self, args: Sequence[str]) -> tuple[List[str], List[str]]:
         input_files: List[str] = []
         extra_args: List[str] = []
@@ -186,7 +207,7 @@ class _Parser:
         return BuiltinFunctor(
             name,
             command,
-            default_extra_args=list(args) if args else None,
+            default_extra_args=args or None,
         )
 
     def _peek(self) -> str | None:
@@ -208,3 +229,12 @@ class _Parser:
             raise ParseError(f"Unexpected token '{token}'.")
         self.pos += 1
         return token
+
+
+def _is_helper_path(name: str) -> bool:
+    """Whether ``name`` lies under a ``_``-prefixed directory (e.g. ``_lib/``).
+
+    Such directories hold shared helper modules for the scripts, not commands.
+    """
+    parts = name.replace(os.sep, "/").split("/")
+    return any(part.startswith("_") for part in parts[:-1])
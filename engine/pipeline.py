@@ -1,35 +1,49 @@
 from __future__ import annotations
 
 import sys
-from typing import Sequence
+from typing import Iterator, Sequence
 
 from .context import Context, INPUT_FIELDS, InputPayload, JsonMapping, OutputPayload
-from .functors import Functor, FunctorExecutionError
+from .functors import BuiltinFunctor, Functor, FunctorExecutionError
 
 
 def _normalize_initial_payload(context: Context, payload: InputPayload | None) -> JsonMapping:
     normalized: JsonMapping = {
-        "input_files": [str(context.path)],
-        "extra_args": [],
+        "input_files": (context._path_str,),
+        "extra_args": (),
     }
     if not payload:
         return normalized
 
-    unknown = set(payload.keys()) - INPUT_FIELDS
-    if unknown:
+    if not INPUT_FIELDS.issuperset(payload):
+        unknown = sorted(set(payload.keys()) - INPUT_FIELDS)
         raise FunctorExecutionError(
-            f"Pipeline received unsupported fields: {', '.join(sorted(unknown))}"
+            f"Pipeline received unsupported fields: {', '.join(unknown)}"
         )
 
     if "input_files" in payload:
-        normalized["input_files"] = list(payload["input_files"])
+        normalized["input_files"] = tuple(payload["input_files"])
 
     if "extra_args" in payload:
-        normalized["extra_args"] = list(payload["extra_args"])
+        normalized["extra_args"] = tuple(payload["extra_args"])
 
     return normalized
 
 
+def _group_stages(functors: Sequence[Functor]) -> Iterator[Sequence[Functor]]:
+    """Yield functors one at a time, keeping runs of consecutive builtins together."""
+    start = 0
+    count = len(functors)
+    while start < count:
+        end = start + 1
+        # Only exact BuiltinFunctor instances are fused; subclasses may override execute().
+        if type(functors[start]) is BuiltinFunctor:
+            while end < count and type(functors[end]) is BuiltinFunctor:
+                end += 1
+        yield functors[start:end]
+        start = end
+
+
 def pipe_process(
     functors: Sequence[Functor],
     context: Context,
@@ -37,23 +51,37 @@ def pipe_process(
 ) -> OutputPayload:
     """
     Sequentially execute functors, piping output_files to the next command's input_files.
+
+    Runs of consecutive BuiltinFunctors are connected with kernel pipes, so their
+    intermediate output is never split into ``output_files``. When such a run
+    prints nothing or one of its stages fails, ``output_files`` falls back to
+    the run's own input: ``[ls, sleep 0]`` returns the input given to ``ls``,
+    not its listing.
     """
     if not functors:
         raise ValueError("pipe_process requires at least one functor.")
 
+    # Validated once here; every payload built below only carries the known keys.
     current_payload = _normalize_initial_payload(context, input_json)
     last_output: OutputPayload = {
-        "output_files": list(current_payload["input_files"]),
+        "output_files": current_payload["input_files"],
         "is_success": True,
         "error_message": None,
     }
 
-    for functor in functors:
-        result = functor(context, current_payload)
+    for stages in _group_stages(functors):
+        functor = stages[0]
+        if len(stages) > 1:
+            # Consecutive builtins share one OS pipeline (see BuiltinFunctor.run_chain).
+            chain_payload = functor._normalize_input(context, current_payload, trusted=True)
+            result, functor = BuiltinFunctor.run_chain(context, stages, chain_payload)
+        else:
+            result = functor(context, current_payload, trusted=True)
 
         if not result.get("is_success"):
             error_message = result.get("error_message") or "Unknown error."
-            print(f"[pipe] {functor.name} failed: {error_message}", file=sys.stderr)
+            # One write: print() would emit the message and the newline separately.
+            sys.stderr.write(f"[pipe] {functor.name} failed: {error_message}\n")
             failure_output = dict(result)
             failure_output.setdefault("failed_at", functor.name)
             return failure_output
@@ -65,8 +93,8 @@ def pipe_process(
             )
 
         current_payload = {
-            "input_files": list(output_files),
-            "extra_args": [],
+            "input_files": tuple(output_files),
+            "extra_args": (),
         }
         last_output = result
 
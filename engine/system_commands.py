@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from pathlib import Path
-import tempfile
+from operator import attrgetter
+import os
+import stat
 from typing import Any, Dict, List, MutableMapping
 
 JsonMapping = MutableMapping[str, Any]
 
+_entry_name = attrgetter("name")
+
 
 def get_default_system_funcs():
     return {
@@ -16,7 +19,10 @@ def get_default_system_funcs():
 
 
 def history_command(payload: JsonMapping, context) -> Dict:
-    entries = list(context.history)
+    entries = [
+        " ".join((name, *input_files, *extra_args))
+        for name, input_files, extra_args in context.history
+    ]
     return {
         "output_files": entries,
         "is_success": True,
@@ -45,7 +51,7 @@ def run_command(payload: JsonMapping, context) -> Dict:
         last_result = result
 
     return {
-        "output_files": list(last_result.get("output_files", [])) if last_result else [],
+        "output_files": last_result.get("output_files", []) if last_result else [],
         "is_success": True,
         "error_message": None,
     }
@@ -58,23 +64,28 @@ def list_command(payload: JsonMapping, context) -> Dict:
     if payload.get("extra_args"):
         targets.extend(payload["extra_args"])
     if not targets:
-        targets.append(str(context.path))
+        targets.append(context._path_str)
 
     listed: List[str] = []
     missing: List[str] = []
     for target in targets:
-        path = Path(target).expanduser()
-        if not path.is_absolute():
-            path = (context.path / path).resolve()
-        if not path.exists():
-            missing.append(str(path))
+        # abspath is purely lexical, unlike Path.resolve() which lstat()s every component.
+        path = os.path.abspath(os.path.join(context._path_str, os.path.expanduser(target)))
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            missing.append(path)
             continue
-        if path.is_dir():
-            children = sorted(path.iterdir(), key=lambda p: p.name)
-            for child in children:
-                listed.append(str(child.resolve()))
+        if stat.S_ISDIR(st.st_mode):
+            # Adding, removing or renaming an entry bumps the directory's mtime.
+            children = context.cached_listing(path, st.st_mtime_ns)
+            if children is None:
+                with os.scandir(path) as entries:
+                    children = tuple(entry.path for entry in sorted(entries, key=_entry_name))
+                context.cache_listing(path, st.st_mtime_ns, children)
+            listed.extend(children)
         else:
-            listed.append(str(path.resolve()))
+            listed.append(path)
 
     return {
         "output_files": listed,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Callable, Dict, List, Tuple
 
 from .functors import (
     BuiltinFunctor,
@@ -11,49 +11,123 @@ from .functors import (
     UserDefinedFunctor,
 )
 
+# One output line: nesting depth and the functor's description.
+Row = Tuple[int, str]
+
+# Indentation strings for common depths; deeper levels fall back to "  " * depth.
+_INDENTS = tuple("  " * depth for depth in range(32))
+
+# Marks a stack entry whose children have not been pushed yet.
+_ENTER = -1
+
 
 def visualize(functor: Functor) -> str:
     """
     Produce a human-readable tree representation of a functor hierarchy.
+
+    The flattened rows are cached on the root functor, so visualizing the same
+    plan again (the engine reuses parsed plans) skips the walk. Plans are not
+    expected to change after parsing; the cache is not invalidated if they do.
+    """
+    schedule = getattr(functor, "_viz_schedule", None)
+    if schedule is None:
+        schedule = tuple(_render(functor))
+        functor._viz_schedule = schedule
+
+    indents = _INDENTS
+    return "\n".join(
+        f"{indents[depth] if depth < len(indents) else '  ' * depth}{descriptor}"
+        for depth, descriptor in schedule
+    )
+
+
+def _render(root: Functor) -> List[Row]:
+    """Flatten ``root`` into ``(depth, descriptor)`` rows in display order.
+
+    Walks an explicit stack, so deep plans cannot hit the recursion limit. A plan
+    can reuse one functor object in several places; ``spans`` remembers where
+    each functor's rows landed (by identity) so a shared subtree is described
+    once and later copied with its depth shifted.
     """
-    lines: List[str] = []
-    _render(functor, lines, 0)
-    return "\n".join(lines)
+    rows: List[Row] = []
+    spans: Dict[int, Tuple[int, int, int]] = {}
+    stack: List[Tuple[Functor, int, int]] = [(root, 0, _ENTER)]
 
+    while stack:
+        functor, depth, start = stack.pop()
+        if start != _ENTER:
+            # Every child has been emitted; record the finished subtree.
+            spans[id(functor)] = (start, len(rows), depth)
+            continue
 
-def _render(functor: Functor, lines: List[str], depth: int) -> None:
-    indent = "  " * depth
-    descriptor = _describe_functor(functor)
-    lines.append(f"{indent}{descriptor}")
+        span = spans.get(id(functor))
+        if span is not None:
+            first, end, base = span
+            shift = depth - base
+            rows.extend((row_depth + shift, descriptor) for row_depth, descriptor in rows[first:end])
+            continue
 
-    if isinstance(functor, SequentialFunctor):
-        for child in functor.functors:
-            _render(child, lines, depth + 1)
-    elif isinstance(functor, ParallelFunctor):
-        for child in functor.functors:
-            _render(child, lines, depth + 1)
+        start = len(rows)
+        rows.append((depth, _describe_functor(functor)))
+        if isinstance(functor, (SequentialFunctor, ParallelFunctor)):
+            stack.append((functor, depth, start))
+            stack.extend((child, depth + 1, _ENTER) for child in reversed(functor.functors))
+        else:
+            spans[id(functor)] = (start, start + 1, depth)
+
+    return rows
 
 
 def _describe_functor(functor: Functor) -> str:
-    base = f"{functor.name} ({functor.__class__.__name__})"
-    details: List[str] = []
+    cls = type(functor)
+    describe = _DESCRIBERS.get(cls) or _describer_for(cls)
+    detail = describe(functor)
+
+    try:
+        default_inputs = functor._default_input_files
+        default_args = functor._default_extra_args
+    except AttributeError:  # subclass that skipped Functor.__init__
+        default_inputs = getattr(functor, "_default_input_files", None)
+        default_args = getattr(functor, "_default_extra_args", None)
 
-    default_inputs = getattr(functor, "_default_input_files", None)
+    if not default_inputs and not default_args:
+        # Common case: at most one detail, formatted straight into the line.
+        if detail is None:
+            return f"{functor.name} ({cls.__name__})"
+        return f"{functor.name} ({cls.__name__}) [{detail}]"
+
+    # Defaults are stored as tuples but shown in list form, as before.
+    details: List[str] = []
     if default_inputs:
         details.append(f"inputs={list(default_inputs)}")
-
-    default_args = getattr(functor, "_default_extra_args", None)
     if default_args:
         details.append(f"args={list(default_args)}")
+    if detail is not None:
+        details.append(detail)
+    return f"{functor.name} ({cls.__name__}) [{' | '.join(details)}]"
+
+
+def _no_detail(functor: Functor) -> str | None:
+    return None
+
 
-    if isinstance(functor, BuiltinFunctor):
-        details.append(f"command={functor.command}")
-    elif isinstance(functor, UserDefinedFunctor):
-        details.append(f"script={functor.script_path}")
-    elif isinstance(functor, SystemFunctor):
-        details.append("system")
+# Class-specific detail for _describe_functor, looked up by exact type.
+_DESCRIBERS: Dict[type, Callable[[Functor], str | None]] = {
+    BuiltinFunctor: lambda functor: f"command={functor.command}",
+    UserDefinedFunctor: lambda functor: f"script={functor.script_path}",
+    SystemFunctor: lambda functor: "system",
+    SequentialFunctor: _no_detail,
+    ParallelFunctor: _no_detail,
+}
 
-    if not details:
-        return base
 
-    return f"{base} [{' | '.join(details)}]"
+def _describer_for(cls: type) -> Callable[[Functor], str | None]:
+    """Resolve a subclass through its MRO and remember the answer."""
+    for base in cls.__mro__:
+        describe = _DESCRIBERS.get(base)
+        if describe is not None:
+            break
+    else:
+        describe = _no_detail
+    _DESCRIBERS[cls] = describe
+    return describe
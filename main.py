@@ -14,6 +14,11 @@ except ImportError:  # pragma: no cover - fallback when running as script
     sys.path.append(str(current_dir.parent))
     from astro_cli import Context, visualize  # type: ignore
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 def main() -> None:
     args = _parse_args()
@@ -46,8 +51,8 @@ def main() -> None:
             continue
 
         if args.debug:
-            print("Functor tree:")
-            print(visualize(functor))
+            sys.stdout.write(f"Functor tree:\n{visualize(functor)}\n")
+        sys.stdout.flush()
 
         try:
             result = engine.execute(context, functor)
@@ -55,8 +60,14 @@ def main() -> None:
             print(f"[execution error] {exc}")
             continue
 
-        print("Result:")
-        print(json.dumps(result, indent=2))
+        sys.stdout.write(f"Result:\n{_format_result(result)}\n")
+        sys.stdout.flush()
+
+
+def _format_result(result) -> str:
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(result, indent=2)
 
 
 def _parse_args() -> argparse.Namespace:
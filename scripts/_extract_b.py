@@ -2,54 +2,39 @@
 from __future__ import annotations
 """Extract the blue channel from images."""
 
-import json
-import sys
-from pathlib import Path
+import os
 from typing import List
 
+from _lib.script_io import read_payload, write_failure, write_file, write_success
+
+_HEADER = b"Blue channel extracted from "
+
 
 def extract_blue(inputs: List[str]) -> List[str]:
     outputs: List[str] = []
     for src in inputs:
-        source_path = Path(src).resolve()
-        if not source_path.exists():
+        # abspath is lexical; resolve() would lstat every path component.
+        source_path = os.path.abspath(src)
+        if not os.path.exists(source_path):
             continue
 
-        destination = source_path.with_name(f"{source_path.stem}_B{source_path.suffix or '.channel'}")
-        destination.write_text(f"Blue channel extracted from {source_path}\n")
-        outputs.append(str(destination))
+        root, suffix = os.path.splitext(source_path)
+        destination = f"{root}_B{suffix or '.channel'}"
+        write_file(destination, _HEADER, os.fsencode(source_path), b"\n")
+        outputs.append(destination)
     return outputs
 
 
 def main() -> None:
-    payload = json.loads(sys.stdin.read() or "{}")
+    payload = read_payload()
     input_files = payload.get("input_files") or []
     buffer_path = payload.get("output_buffer")
     if not input_files:
-        result = {
-            "output_files": [],
-            "is_success": False,
-            "error_message": "extract_b requires at least one input file.",
-        }
-        _write_result(buffer_path, result)
+        write_failure(buffer_path, "extract_b requires at least one input file.")
         return
 
     outputs = extract_blue(input_files)
-
-    result = {
-        "output_files": outputs,
-        "is_success": True,
-        "error_message": None,
-    }
-    _write_result(buffer_path, result)
-
-
-def _write_result(buffer_path: str | None, result: dict) -> None:
-    if not buffer_path:
-        json.dump(result, sys.stdout)
-        return
-    Path(buffer_path).write_text(json.dumps(result))
-
+    write_success(buffer_path, outputs)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,54 @@
+"""Shared implementation of the test scripts; each script is a role in ROLES."""
+from __future__ import annotations
+
+import os
+from typing import Callable, Dict, List, Sequence
+
+from .script_io import read_payload, write_file, write_success
+
+# Fallbacks used when the payload leaves the corresponding field empty.
+_DEFAULT_OUT = "./aggregate.out"
+_DEFAULT_DIR = "./output"
+_DEFAULT_INPUTS = ("./input.txt",)
+
+
+def aggregate(inputs: Sequence[str], extra_args: Sequence[str]) -> List[str]:
+    output = os.path.abspath(extra_args[0] if extra_args else _DEFAULT_OUT)
+    content = "\n".join(inputs) if inputs else "no inputs"
+    write_file(output, b"Aggregated:\n", os.fsencode(content), b"\n")
+    return [output]
+
+
+def convert(inputs: Sequence[str], extra_args: Sequence[str]) -> List[str]:
+    out_dir = os.path.abspath(extra_args[0] if extra_args else _DEFAULT_DIR)
+    os.makedirs(out_dir, exist_ok=True)
+    prefix = os.path.join(out_dir, "converted_")
+    outputs = []
+    for index, src in enumerate(inputs or [os.path.join(out_dir, "placeholder.txt")]):
+        dest = f"{prefix}{index}.dat"
+        write_file(dest, b"Converted from ", os.fsencode(src), b"\n")
+        outputs.append(dest)
+    return outputs
+
+
+def filter_files(inputs: Sequence[str], extra_args: Sequence[str]) -> List[str]:
+    outputs = []
+    for index, src in enumerate(inputs or _DEFAULT_INPUTS):
+        root, _ = os.path.splitext(src)
+        dest = f"{root}.filtered{index}"
+        write_file(dest, b"Filtered: ", os.fsencode(src), b"\n")
+        outputs.append(dest)
+    return outputs
+
+
+ROLES: Dict[str, Callable[[Sequence[str], Sequence[str]], List[str]]] = {
+    "aggregate": aggregate,
+    "convert": convert,
+    "filter": filter_files,
+}
+
+
+def run(role: str) -> None:
+    payload = read_payload()
+    outputs = ROLES[role](payload.get("input_files") or (), payload.get("extra_args") or ())
+    write_success(payload.get("output_buffer"), outputs)
@@ -0,0 +1,75 @@
+"""Shared stdin/stdout helpers for the bundled scripts."""
+from __future__ import annotations
+
+from functools import lru_cache
+import os
+import sys
+from typing import Any, Dict, Sequence
+
+# JSON facade: ``loads`` accepts bytes and ``dumps`` always returns bytes, with
+# orjson used when it is installed.
+try:
+    from orjson import dumps, loads
+except ImportError:  # pragma: no cover - optional dependency
+    import json
+    from json import loads
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+# The result schema is fixed, so only the varying fields go through the encoder.
+_RESULT_HEAD = b'{"output_files":'
+_SUCCESS_TAIL = b',"is_success":true,"error_message":null}'
+_FAILURE_MIDDLE = b',"is_success":false,"error_message":'
+
+
+def read_payload() -> Dict[str, Any]:
+    """Parse the engine's JSON payload straight from the raw stdin bytes."""
+    data = sys.stdin.buffer.read()
+    if not data:
+        return {}
+    return loads(data)
+
+
+def write_success(buffer_path: str | None, outputs: Sequence[str]) -> None:
+    """Report a successful run producing ``outputs``."""
+    _emit(buffer_path, _RESULT_HEAD + dumps(outputs) + _SUCCESS_TAIL)
+
+
+def write_failure(buffer_path: str | None, message: str, outputs: Sequence[str] = ()) -> None:
+    """Report a failed run with ``message`` and whatever ``outputs`` were produced."""
+    _emit(buffer_path, _RESULT_HEAD + (dumps(outputs) if outputs else b"[]") + _failure_tail(message))
+
+
+@lru_cache(maxsize=32)
+def _failure_tail(message: str) -> bytes:
+    # Failure messages are mostly constants, so a long-lived runner encodes each once.
+    return _FAILURE_MIDDLE + dumps(message) + b"}"
+
+
+def _emit(buffer_path: str | None, data: bytes) -> None:
+    """Write ``data`` to the engine's output buffer, or to stdout when there is none."""
+    if not buffer_path:
+        # Flush pending log text first so the JSON is not interleaved with it.
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+        return
+
+    write_file(buffer_path, data)
+
+
+def write_file(path: str, *chunks: bytes) -> None:
+    """Create or truncate ``path`` and write ``chunks`` with a single gathered write."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        written = os.writev(fd, chunks)
+        if written < sum(map(len, chunks)):
+            # Short write (e.g. a full disk or a signal); finish the remainder.
+            view = memoryview(b"".join(chunks))[written:]
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
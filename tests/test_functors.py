@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import os
+import tempfile
+
+from astro_cli import Context, pipe_process
+from astro_cli.engine.functors import (
+    _STDIN_STREAM_THRESHOLD,
+    SHARED_MEMORY_THRESHOLD,
+    BuiltinFunctor,
+    ParallelFunctor,
+    SequentialFunctor,
+)
+
+
+class CpuBoundBuiltin(BuiltinFunctor):
+    # Nothing in the tree sets cpu_bound yet; this routes branches to the process pool.
+    cpu_bound = True
+
+
+def test_builtin_input_round_trips() -> None:
+    # Short input is joined for communicate(); long input is streamed in chunks.
+    with tempfile.TemporaryDirectory() as root:
+        ctx = Context(path=root, scripts_path=root)
+        cat = BuiltinFunctor("cat", ["cat"])
+        for count in (3, _STDIN_STREAM_THRESHOLD + 1, 5 * _STDIN_STREAM_THRESHOLD):
+            files = [f"{root}/frame_{index:07d}.fits" for index in range(count)]
+            result = cat(ctx, {"input_files": files})
+            assert result["is_success"]
+            assert list(result["output_files"]) == files
+
+
+def _chain_context(root: str) -> Context:
+    for name in ("a.fits", "b.fits"):
+        with open(os.path.join(root, name), "w"):
+            pass
+    scripts = os.path.join(root, "scripts")
+    os.mkdir(scripts)
+    return Context(path=root, scripts_path=scripts)
+
+
+def _run_chain(ctx: Context, command: str) -> dict:
+    functor = ctx.engine.parse(ctx, command)
+    assert isinstance(functor, SequentialFunctor) and functor._builtin_chain
+    return functor(ctx, {"input_files": ["chain-input"]})
+
+
+def test_builtin_chain_success() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        result = _run_chain(_chain_context(root), "ls | sort -r")
+        assert result["is_success"]
+        assert list(result["output_files"]) == ["scripts", "b.fits", "a.fits"]
+
+
+def test_builtin_chain_upstream_sigpipe_is_not_a_failure() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        result = _run_chain(_chain_context(root), "seq 100000 | head -1")
+        assert result["is_success"]
+        assert list(result["output_files"]) == ["1"]
+
+
+def test_builtin_chain_missing_command() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        result = _run_chain(_chain_context(root), "ls | sort | astro_cli_no_such_command | wc -l")
+        assert not result["is_success"]
+        assert "astro_cli_no_such_command" in result["error_message"]
+        assert list(result["output_files"]) == ["chain-input"]
+
+
+def test_builtin_chain_upstream_failure() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        result = _run_chain(_chain_context(root), "ls no_such_dir | sort")
+        assert not result["is_success"]
+        assert "no_such_dir" in result["error_message"]
+        # Falls back to the chain's input, not to the failing stage's input.
+        assert list(result["output_files"]) == ["chain-input"]
+
+
+def test_builtin_chain_empty_output_falls_back_to_chain_input() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        ctx = _chain_context(root)
+        # Stage by stage, both of these would yield the ls listing instead.
+        result = _run_chain(ctx, "ls | sleep 0")
+        assert result["is_success"]
+        assert list(result["output_files"]) == ["chain-input"]
+
+        result = _run_chain(ctx, "ls | grep zzz | wc -l")
+        assert not result["is_success"]
+        assert list(result["output_files"]) == ["chain-input"]
+
+
+def test_pipe_process_fused_run_falls_back_to_run_input() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        ctx = _chain_context(root)
+        ls = BuiltinFunctor("ls", ["ls"])
+        result = pipe_process([ls, BuiltinFunctor("sort", ["sort", "-r"])], ctx)
+        assert result["is_success"]
+        assert list(result["output_files"]) == ["scripts", "b.fits", "a.fits"]
+
+        # Stage by stage, this would yield the ls listing instead.
+        result = pipe_process([ls, BuiltinFunctor("sleep", ["sleep", "0"])], ctx)
+        assert result["is_success"]
+        assert list(result["output_files"]) == [root]
+
+        grep = BuiltinFunctor("grep", ["grep", "zzz"])
+        result = pipe_process([ls, grep, BuiltinFunctor("wc", ["wc", "-l"])], ctx)
+        assert not result["is_success"]
+        assert result["failed_at"] == "grep"
+        assert list(result["output_files"]) == [root]
+
+
+def _shared_memory_blocks() -> set[str]:
+    try:
+        return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")}
+    except OSError:
+        return set()
+
+
+def test_cpu_bound_branches_run_in_processes() -> None:
+    # More inputs than the threshold, so file lists cross through shared memory both ways.
+    with tempfile.TemporaryDirectory() as root:
+        ctx = Context(path=root, scripts_path=root)
+        files = [f"{root}/frame_{index:07d}.fits" for index in range(3 * SHARED_MEMORY_THRESHOLD)]
+        parallel = ParallelFunctor(
+            "parallel",
+            [CpuBoundBuiltin("cat", ["cat"]), CpuBoundBuiltin("sort", ["sort", "-r"])],
+        )
+        before = _shared_memory_blocks()
+        try:
+            result = parallel(ctx, {"input_files": files})
+        finally:
+            ctx.engine.shutdown()
+        assert result["is_success"], result["error_message"]
+        assert list(result["output_files"]) == files + files[::-1]
+        assert _shared_memory_blocks() == before
+
+
+def main() -> None:
+    test_builtin_input_round_trips()
+    test_builtin_chain_success()
+    test_builtin_chain_upstream_sigpipe_is_not_a_failure()
+    test_builtin_chain_missing_command()
+    test_builtin_chain_upstream_failure()
+    test_builtin_chain_empty_output_falls_back_to_chain_input()
+    test_pipe_process_fused_run_falls_back_to_run_input()
+    test_cpu_bound_branches_run_in_processes()
+    print("functor checks passed")
+
+
+if __name__ == "__main__":
+    main()
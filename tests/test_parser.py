@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+
+from astro_cli import Context
+from astro_cli.engine.functors import BuiltinFunctor, UserDefinedFunctor
+from astro_cli.engine.parser import ParseError, _tokenize, parse
+
+
+def test_quoted_tokens() -> None:
+    assert _tokenize('a "b c" \'d|e\' (f, g)') == ["a", "b c", "d|e", "(", "f", ",", "g", ")"]
+
+
+def test_unterminated_quote_after_long_prefix_fails_fast() -> None:
+    # A backtracking quote check used to take seconds here, doubling per character.
+    for command in ("a" * 5000 + "'", 'find /home/user/projects -name "*.py' + " x" * 2000):
+        start = time.perf_counter()
+        try:
+            _tokenize(command)
+        except ParseError:
+            pass
+        else:
+            raise AssertionError(f"expected ParseError for {command[:20]!r}...")
+        assert time.perf_counter() - start < 0.5
+
+
+def test_engine_cache_sees_new_nested_script() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        scripts = os.path.join(root, "scripts")
+        os.makedirs(os.path.join(scripts, "sub"))
+        ctx = Context(path=root, scripts_path=scripts)
+        assert isinstance(ctx.engine.parse(ctx, "sub/foo"), BuiltinFunctor)
+
+        # Only the subdirectory's mtime changes, not the scripts root's.
+        with open(os.path.join(scripts, "sub", "foo.py"), "w"):
+            pass
+        assert isinstance(ctx.engine.parse(ctx, "sub/foo"), UserDefinedFunctor)
+
+
+def test_context_script_cache_sees_new_top_level_script() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        ctx = Context(path=root, scripts_path=root)
+        assert isinstance(parse("tool", ctx), BuiltinFunctor)
+
+        with open(os.path.join(root, "tool.py"), "w"):
+            pass
+        assert isinstance(parse("tool", ctx), UserDefinedFunctor)
+
+
+def test_helper_modules_are_not_commands() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        scripts = os.path.join(root, "scripts")
+        os.makedirs(os.path.join(scripts, "_lib"))
+        for path in ("tool.py", os.path.join("_lib", "helpers.py")):
+            with open(os.path.join(scripts, path), "w"):
+                pass
+        ctx = Context(path=root, scripts_path=scripts)
+        assert isinstance(ctx.engine.parse(ctx, "tool"), UserDefinedFunctor)
+        assert isinstance(ctx.engine.parse(ctx, "_lib/helpers"), BuiltinFunctor)
+
+
+def main() -> None:
+    test_quoted_tokens()
+    test_unterminated_quote_after_long_prefix_fails_fast()
+    test_engine_cache_sees_new_nested_script()
+    test_context_script_cache_sees_new_top_level_script()
+    test_helper_modules_are_not_commands()
+    print("parser checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+
 from astro_cli import Context, parse, visualize
 
 
@@ -17,14 +19,18 @@ def build_context() -> Context:
     )
 
 
+def _parse_and_visualize(cmd: str) -> str:
+    # Runs in a worker process, so it builds its own context.
+    return visualize(parse(cmd, build_context()))
+
+
 def showcase(commands: list[str]) -> None:
-    ctx = build_context()
-    for cmd in commands:
-        functor = parse(cmd, ctx)
-        tree = visualize(functor)
-        print(f"Command: {cmd}")
-        print(tree)
-        print("-" * 40)
+    with ProcessPoolExecutor() as pool:
+        trees = pool.map(_parse_and_visualize, commands)
+        for cmd, tree in zip(commands, trees):
+            print(f"Command: {cmd}")
+            print(tree)
+            print("-" * 40)
 
 
 def main() -> None: